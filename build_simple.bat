@@ -13,7 +13,7 @@ if not exist "Icons" mkdir "Icons"
 
 echo.
 echo Installing/updating dependencies...
-pip install --upgrade cx-Freeze PyQt5 psutil py7zr
+pip install --upgrade cx-Freeze PyQt5 py7zr
 
 echo.
 echo Building executables...
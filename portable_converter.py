@@ -10,6 +10,8 @@ import json
 import shutil
 import subprocess
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -21,16 +23,154 @@ from PyQt5.QtWidgets import (
     QGroupBox, QSplitter, QStatusBar, QMenuBar, QAction, QComboBox,
     QCheckBox, QSpinBox, QFormLayout
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSettings
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QSettings
+)
 from PyQt5.QtGui import QIcon, QFont, QPalette, QColor
 
-import psutil
-import py7zr
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Larger copy buffers cut syscall counts on fast storage at the cost of a
+# few MB of extra memory; py7zr already compresses in 1 MiB reads
+COPY_BUFFER_SIZE = 1024 * 1024
+if hasattr(shutil, 'COPY_BUFSIZE'):
+    shutil.COPY_BUFSIZE = COPY_BUFFER_SIZE
+
+# Dark theme, applied once on the QApplication so Qt parses it a single time
+DARK_QSS = """
+QMainWindow {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QPushButton {
+    background-color: #404040;
+    border: 1px solid #606060;
+    padding: 5px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #505050;
+}
+QPushButton:pressed {
+    background-color: #353535;
+}
+QPushButton:disabled {
+    background-color: #2b2b2b;
+    color: #808080;
+}
+QListWidget {
+    background-color: #353535;
+    border: 1px solid #606060;
+}
+QTextEdit {
+    background-color: #353535;
+    border: 1px solid #606060;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #606060;
+    border-radius: 5px;
+    margin-top: 1ex;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QProgressBar {
+    border: 1px solid #606060;
+    border-radius: 3px;
+    text-align: center;
+}
+QProgressBar::chunk {
+    background-color: #4CAF50;
+    border-radius: 2px;
+}
+"""
+
+
+def _fast_copy(src: str, dst: str):
+    """Copy a file with the platform's in-kernel copy primitive, then its metadata"""
+    src, dst = str(src), str(dst)
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+                raise ctypes.WinError()
+        elif sys.platform.startswith("linux"):
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                offset = 0
+                while True:
+                    sent = os.sendfile(out_fd, in_fd, offset, COPY_BUFFER_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
+        else:
+            # On macOS shutil.copyfile already goes through fcopyfile()
+            shutil.copyfile(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+
+def _find_7z_executable() -> Optional[str]:
+    """Locate a native 7-Zip binary, preferring one bundled next to the converter"""
+    app_root = Path(sys.executable if getattr(sys, 'frozen', False) else __file__).parent
+    for name in ("7z.exe", "7za.exe", "7zz"):
+        bundled = app_root / name
+        if bundled.is_file():
+            return str(bundled)
+    for name in ("7z", "7zz", "7za"):
+        found = shutil.which(name)
+        if found:
+            return found
+    if sys.platform == "win32":
+        for base in (os.environ.get("ProgramFiles"), os.environ.get("ProgramFiles(x86)")):
+            if base and Path(base, "7-Zip", "7z.exe").is_file():
+                return str(Path(base, "7-Zip", "7z.exe"))
+    return None
+
+
+def _noop(_path: str):
+    pass
+
+
+def _scan_directory(directory: str) -> Tuple[List[str], List[str], List[str]]:
+    """Return the DLLs, config files and subdirectories directly inside directory"""
+    dlls, configs, subdirs = [], [], []
+    dispatch = {'dll': dlls.append, 'ini': configs.append, 'cfg': configs.append}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    _stem, dot, suffix = entry.name.rpartition('.')
+                    if dot:
+                        dispatch.get(suffix.lower(), _noop)(entry.path)
+    except OSError:
+        pass
+    return dlls, configs, subdirs
 
 
 class PortableApp:
     """Represents a portable application"""
     
+    FIELDS = ('name', 'original_path', 'portable_path', 'size',
+              'created_date', 'version', 'last_run')
+    __slots__ = ('name', 'original_path', 'portable_path', '_size', '_size_label',
+                 'created_date', 'version', 'last_run')
+    
     def __init__(self, name: str, original_path: str, portable_path: str, 
                  size: int = 0, created_date: str = "", version: str = ""):
         self.name = name
@@ -40,17 +180,26 @@ class PortableApp:
         self.created_date = created_date or datetime.now().isoformat()
         self.version = version
         self.last_run = ""
+    
+    @property
+    def size(self) -> int:
+        return self._size
+    
+    @size.setter
+    def size(self, value: int):
+        self._size = value
+        self._size_label = None
+    
+    @property
+    def size_label(self) -> str:
+        """Human readable size, formatted once per size change"""
+        if self._size_label is None:
+            size_mb = self._size / (1024 * 1024) if self._size > 0 else 0
+            self._size_label = f"{size_mb:.1f} MB"
+        return self._size_label
         
     def to_dict(self) -> Dict:
-        return {
-            'name': self.name,
-            'original_path': self.original_path,
-            'portable_path': self.portable_path,
-            'size': self.size,
-            'created_date': self.created_date,
-            'version': self.version,
-            'last_run': self.last_run
-        }
+        return {field: getattr(self, field) for field in self.FIELDS}
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'PortableApp':
@@ -63,27 +212,61 @@ class PortableApp:
         return app
 
 
-class ConversionWorker(QThread):
-    """Worker thread for app conversion to avoid UI freezing"""
+class WorkerSignals(QObject):
+    """Signals emitted by a ConversionWorker, QRunnable cannot define its own"""
     
     progress = pyqtSignal(int)
     status = pyqtSignal(str)
-    finished = pyqtSignal(bool, str)
+    finished = pyqtSignal(bool, str, object)
+
+
+class ConversionWorker(QRunnable):
+    """Pooled worker for app conversion to avoid UI freezing"""
     
     def __init__(self, app_path: str, output_dir: str, compression_level: int = 5):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.progress = self.signals.progress
+        self.status = self.signals.status
+        self.finished = self.signals.finished
         self.app_path = app_path
-        self.output_dir = output_dir
+        # Absolute, since native 7-Zip runs with the portable directory as cwd
+        self.output_dir = str(Path(output_dir).resolve())
         self.compression_level = compression_level
         self.cancelled = False
+        self._last_emit = 0.0
+        self._done = threading.Event()
     
     def cancel(self):
         self.cancelled = True
     
+    def is_running(self) -> bool:
+        return not self._done.is_set()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until run() has returned"""
+        return self._done.wait(timeout)
+    
+    def _emit_progress(self, percent: int, message: Optional[str] = None):
+        """Emit progress at most every 50 ms; stage messages and completion always go through"""
+        now = time.monotonic()
+        if message is None and percent < 100 and now - self._last_emit < 0.05:
+            return
+        self._last_emit = now
+        self.progress.emit(percent)
+        if message is not None:
+            self.status.emit(message)
+    
     def run(self):
         try:
-            self.status.emit("Analyzing application...")
-            self.progress.emit(10)
+            self._convert()
+        finally:
+            self._done.set()
+    
+    def _convert(self):
+        try:
+            self._emit_progress(10, "Analyzing application...")
             
             if self.cancelled:
                 return
@@ -92,86 +275,107 @@ class ConversionWorker(QThread):
             portable_dir = Path(self.output_dir) / f"{app_name}_Portable"
             portable_dir.mkdir(exist_ok=True)
             
-            self.status.emit("Scanning dependencies...")
-            self.progress.emit(25)
+            self._emit_progress(25, "Scanning dependencies...")
             
-            dependencies = self._scan_dependencies()
+            dependencies, config_files = self._scan_app_neighborhood(str(Path(self.app_path).parent))
             if self.cancelled:
                 return
                 
-            self.status.emit("Copying application files...")
-            self.progress.emit(40)
+            self._emit_progress(40, "Copying application files...")
             
-            self._copy_application_files(portable_dir)
+            self._copy_application_files(portable_dir, config_files)
             if self.cancelled:
                 return
                 
-            self.status.emit("Copying dependencies...")
-            self.progress.emit(60)
+            self._emit_progress(60, "Copying dependencies...")
             
             self._copy_dependencies(dependencies, portable_dir)
             if self.cancelled:
                 return
                 
-            self.status.emit("Creating launcher script...")
-            self.progress.emit(80)
+            self._emit_progress(80, "Creating launcher script...")
             
             self._create_launcher(portable_dir, app_name)
             if self.cancelled:
                 return
                 
-            self.status.emit("Compressing portable app...")
-            self.progress.emit(90)
+            self._emit_progress(90, "Compressing portable app...")
             
             archive_path = self._compress_portable_app(portable_dir)
             if self.cancelled:
                 return
                 
-            self.progress.emit(100)
-            self.status.emit("Conversion completed successfully!")
-            self.finished.emit(True, str(archive_path))
+            self._emit_progress(100, "Conversion completed successfully!")
+            self.finished.emit(True, str(archive_path), archive_path.stat().st_size)
             
         except Exception as e:
-            self.finished.emit(False, str(e))
+            self.finished.emit(False, str(e), 0)
     
-    def _scan_dependencies(self) -> List[str]:
-        """Scan for application dependencies"""
-        dependencies = []
+    def _scan_app_neighborhood(self, app_dir: str) -> Tuple[List[str], List[str]]:
+        """Collect DLLs below app_dir and config files beside the executable in one walk"""
+        dlls, config_files, subdirs = _scan_directory(app_dir)
+        dlls_by_dir = {app_dir: dlls}
         try:
-            # Use basic file scanning for dependencies
-            app_dir = Path(self.app_path).parent
-            for file in app_dir.rglob("*.dll"):
-                if file.is_file():
-                    dependencies.append(str(file))
+            if len(subdirs) < 4:
+                # Small trees are walked inline, a pool would only add overhead
+                while subdirs and not self.cancelled:
+                    directory = subdirs.pop()
+                    dlls, _, found = _scan_directory(directory)
+                    dlls_by_dir[directory] = dlls
+                    subdirs.extend(found)
+            else:
+                # Overlap directory reads across threads, the walk is I/O-bound
+                max_workers = min(32, (os.cpu_count() or 4) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    pending = {executor.submit(_scan_directory, d): d for d in subdirs}
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            directory = pending.pop(future)
+                            dlls, _, found = future.result()
+                            dlls_by_dir[directory] = dlls
+                            if not self.cancelled:
+                                pending.update((executor.submit(_scan_directory, d), d) for d in found)
         except Exception:
             pass
-        return dependencies
+        
+        # Directories finish in any order; merge by path so every run picks the same DLLs
+        dependencies = [dll for directory in sorted(dlls_by_dir)
+                        for dll in sorted(dlls_by_dir[directory])]
+        return dependencies, config_files
     
-    def _copy_application_files(self, portable_dir: Path):
+    def _copy_application_files(self, portable_dir: Path, config_files: List[str]):
         """Copy main application files"""
         app_path = Path(self.app_path)
         dest_path = portable_dir / app_path.name
-        shutil.copy2(self.app_path, dest_path)
+        _fast_copy(self.app_path, dest_path)
         
         # Copy any config files in the same directory
-        for file in app_path.parent.glob("*.ini"):
-            shutil.copy2(file, portable_dir / file.name)
-        for file in app_path.parent.glob("*.cfg"):
-            shutil.copy2(file, portable_dir / file.name)
+        root = str(portable_dir)
+        for config_file in config_files:
+            _fast_copy(config_file, os.path.join(root, os.path.basename(config_file)))
     
     def _copy_dependencies(self, dependencies: List[str], portable_dir: Path):
         """Copy application dependencies"""
         lib_dir = portable_dir / "lib"
         lib_dir.mkdir(exist_ok=True)
         
-        for dep in dependencies[:20]:  # Limit to avoid too many files
-            if self.cancelled:
-                break
-            try:
-                dep_path = Path(dep)
-                shutil.copy2(dep, lib_dir / dep_path.name)
-            except Exception:
-                continue
+        targets = {os.path.basename(dep): dep for dep in dependencies[:20]}  # Limit to avoid too many files
+        lib_root = str(lib_dir)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(_fast_copy, dep, os.path.join(lib_root, name))
+                       for name, dep in targets.items()]
+            for done, future in enumerate(as_completed(futures), 1):
+                if self.cancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                try:
+                    future.result()
+                except Exception:
+                    pass
+                self._emit_progress(60 + 20 * done // len(futures))
     
     def _create_launcher(self, portable_dir: Path, app_name: str):
         """Create a launcher script for the portable app"""
@@ -186,11 +390,35 @@ start "" "{app_name}.exe"
         """Compress the portable app directory"""
         archive_path = portable_dir.with_suffix('.7z')
         
-        with py7zr.SevenZipFile(archive_path, 'w', compression_level=self.compression_level) as archive:
-            for file_path in portable_dir.rglob('*'):
-                if file_path.is_file():
-                    relative_path = file_path.relative_to(portable_dir)
-                    archive.write(file_path, relative_path)
+        seven_zip = _find_7z_executable()
+        if seven_zip:
+            try:
+                # Native 7-Zip runs LZMA2 on all cores, py7zr is single-threaded
+                if archive_path.exists():
+                    archive_path.unlink()
+                subprocess.run(
+                    [seven_zip, 'a', f'-mx={self.compression_level}', '-mmt=on', '-y',
+                     str(archive_path), '*'],
+                    cwd=str(portable_dir), check=True,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+                )
+                shutil.rmtree(portable_dir)
+                return archive_path
+            except (OSError, subprocess.CalledProcessError):
+                pass
+        
+        # Imported lazily, py7zr pulls in several compression backends at import time
+        import py7zr
+        
+        # py7zr takes the level as an LZMA2 preset rather than a keyword argument
+        filters = [{'id': py7zr.FILTER_LZMA2, 'preset': self.compression_level}]
+        with py7zr.SevenZipFile(archive_path, 'w', filters=filters) as archive:
+            # Let py7zr walk each top-level entry; archiving the root itself
+            # would add a "." entry to the archive
+            with os.scandir(portable_dir) as entries:
+                for entry in entries:
+                    archive.writeall(entry.path, arcname=entry.name)
         
         # Clean up the directory after compression
         shutil.rmtree(portable_dir)
@@ -204,11 +432,11 @@ class PortableAppConverter(QMainWindow):
         super().__init__()
         self.portable_apps: List[PortableApp] = []
         self.settings = QSettings('PortableConverter', 'Settings')
-        self.worker = None
+        self.workers: List[ConversionWorker] = []
+        QThreadPool.globalInstance().setMaxThreadCount(os.cpu_count() or 1)
         
         self.init_ui()
         self.load_portable_apps()
-        self.apply_dark_theme()
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -380,64 +608,6 @@ class PortableAppConverter(QMainWindow):
         
         layout.addWidget(info_group)
     
-    def apply_dark_theme(self):
-        """Apply dark theme to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #404040;
-                border: 1px solid #606060;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            QPushButton:pressed {
-                background-color: #353535;
-            }
-            QPushButton:disabled {
-                background-color: #2b2b2b;
-                color: #808080;
-            }
-            QListWidget {
-                background-color: #353535;
-                border: 1px solid #606060;
-            }
-            QTextEdit {
-                background-color: #353535;
-                border: 1px solid #606060;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #606060;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QProgressBar {
-                border: 1px solid #606060;
-                border-radius: 3px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }
-        """)
-    
     def select_application(self):
         """Open file dialog to select application"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -466,42 +636,53 @@ class PortableAppConverter(QMainWindow):
         compression_levels = [9, 7, 5, 3, 1]
         compression_level = compression_levels[self.compression_combo.currentIndex()]
         
-        # Start worker thread
-        self.worker = ConversionWorker(
-            self.app_path_label.text(), output_dir, compression_level
+        self.queue_conversion(self.app_path_label.text(), output_dir, compression_level)
+    
+    def queue_conversion(self, app_path: str, output_dir: str, compression_level: int = 5):
+        """Queue an application for conversion on the shared thread pool"""
+        worker = ConversionWorker(app_path, output_dir, compression_level)
+        worker.progress.connect(self.progress_bar.setValue)
+        worker.status.connect(self.status_label.setText)
+        worker.finished.connect(
+            lambda success, message, size, worker=worker:
+                self.conversion_finished(success, message, size, worker)
         )
-        self.worker.progress.connect(self.progress_bar.setValue)
-        self.worker.status.connect(self.status_label.setText)
-        self.worker.finished.connect(self.conversion_finished)
+        self.workers.append(worker)
         
         self.convert_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
-        self.worker.start()
+        QThreadPool.globalInstance().start(worker)
     
     def cancel_conversion(self):
         """Cancel the conversion process"""
-        if self.worker:
-            self.worker.cancel()
-            self.worker.wait()
-        self.conversion_finished(False, "Cancelled by user")
-    
-    def conversion_finished(self, success: bool, message: str):
+        workers, self.workers = self.workers, []
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            worker.wait()
+        self.conversion_finished(False, "Cancelled by user", 0)
+    
+    def conversion_finished(self, success: bool, message: str, size: int = 0,
+                            worker: Optional[ConversionWorker] = None):
         """Handle conversion completion"""
-        self.convert_btn.setEnabled(True)
-        self.cancel_btn.setEnabled(False)
-        self.progress_bar.setValue(0)
-        self.status_label.setText("Ready to convert")
+        if worker in self.workers:
+            self.workers.remove(worker)
+        if not self.workers:
+            self.convert_btn.setEnabled(True)
+            self.cancel_btn.setEnabled(False)
+            self.progress_bar.setValue(0)
+            self.status_label.setText("Ready to convert")
         
         if success:
             QMessageBox.information(self, "Success", f"Conversion completed!\nPortable app saved to: {message}")
             
             # Add to portable apps list
-            app_name = Path(self.app_path_label.text()).stem
+            app_path = worker.app_path if worker else self.app_path_label.text()
             portable_app = PortableApp(
-                name=app_name,
-                original_path=self.app_path_label.text(),
+                name=Path(app_path).stem,
+                original_path=app_path,
                 portable_path=message,
-                size=Path(message).stat().st_size if Path(message).exists() else 0
+                size=size
             )
             self.portable_apps.append(portable_app)
             self.save_portable_apps()
@@ -511,13 +692,16 @@ class PortableAppConverter(QMainWindow):
     
     def refresh_apps_list(self):
         """Refresh the portable apps list"""
-        self.apps_list.clear()
-        for app in self.portable_apps:
-            size_mb = app.size / (1024 * 1024) if app.size > 0 else 0
-            item_text = f"{app.name} ({size_mb:.1f} MB)"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, app)
-            self.apps_list.addItem(item)
+        # Repaint once after the whole list is rebuilt instead of per item
+        self.apps_list.setUpdatesEnabled(False)
+        try:
+            self.apps_list.clear()
+            for app in self.portable_apps:
+                item = QListWidgetItem(f"{app.name} ({app.size_label})")
+                item.setData(Qt.UserRole, app)
+                self.apps_list.addItem(item)
+        finally:
+            self.apps_list.setUpdatesEnabled(True)
     
     def launch_selected_app(self):
         """Launch the selected portable app"""
@@ -539,7 +723,10 @@ class PortableAppConverter(QMainWindow):
                 )
                 return
             
-            subprocess.Popen([app.portable_path], shell=True)
+            if sys.platform == "win32":
+                os.startfile(app.portable_path)
+            else:
+                subprocess.Popen([app.portable_path], close_fds=True, start_new_session=True)
             app.last_run = datetime.now().isoformat()
             self.save_portable_apps()
             self.status_bar.showMessage(f"Launched {app.name}")
@@ -578,12 +765,11 @@ class PortableAppConverter(QMainWindow):
             return
         
         app = current_item.data(Qt.UserRole)
-        size_mb = app.size / (1024 * 1024) if app.size > 0 else 0
         
         info = f"""Name: {app.name}
 Original Path: {app.original_path}
 Portable Path: {app.portable_path}
-Size: {size_mb:.1f} MB
+Size: {app.size_label}
 Created: {app.created_date[:10] if app.created_date else 'Unknown'}
 Last Run: {app.last_run[:10] if app.last_run else 'Never'}
 Version: {app.version or 'Unknown'}
@@ -593,6 +779,22 @@ Version: {app.version or 'Unknown'}
     def refresh_apps(self):
         """Refresh the apps list"""
         self.load_portable_apps()
+        
+        # One scandir per output directory; DirEntry caches the stat result
+        entries = {}
+        for folder in {os.path.dirname(app.portable_path) for app in self.portable_apps}:
+            try:
+                with os.scandir(folder or '.') as it:
+                    for entry in it:
+                        entries[os.path.normcase(entry.path)] = entry
+            except OSError:
+                continue
+        for app in self.portable_apps:
+            entry = entries.get(os.path.normcase(os.path.join(
+                os.path.dirname(app.portable_path) or '.', os.path.basename(app.portable_path))))
+            if entry is not None and entry.is_file():
+                app.size = entry.stat().st_size
+        
         self.refresh_apps_list()
         self.status_bar.showMessage("Apps list refreshed")
     
@@ -614,8 +816,8 @@ Version: {app.version or 'Unknown'}
         config_path = Path("portable_apps.json")
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    data = json.load(f)
+                raw = config_path.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
                 self.portable_apps = [PortableApp.from_dict(app_data) for app_data in data]
             except Exception as e:
                 print(f"Error loading portable apps: {e}")
@@ -627,14 +829,21 @@ Version: {app.version or 'Unknown'}
         """Save portable apps to configuration"""
         try:
             config_path = Path("portable_apps.json")
-            with open(config_path, 'w') as f:
-                json.dump([app.to_dict() for app in self.portable_apps], f, indent=2)
+            data = [app.to_dict() for app in self.portable_apps]
+            if orjson:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            # Write to a temporary file first so a crash never leaves a truncated config
+            tmp_path = config_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, config_path)
         except Exception as e:
             print(f"Error saving portable apps: {e}")
     
     def closeEvent(self, event):
         """Handle application close event"""
-        if self.worker and self.worker.isRunning():
+        if any(worker.is_running() for worker in self.workers):
             reply = QMessageBox.question(
                 self, "Confirm Exit",
                 "A conversion is in progress. Do you want to cancel it and exit?",
@@ -642,8 +851,10 @@ Version: {app.version or 'Unknown'}
             )
             
             if reply == QMessageBox.Yes:
-                self.worker.cancel()
-                self.worker.wait()
+                for worker in self.workers:
+                    worker.cancel()
+                for worker in self.workers:
+                    worker.wait()
                 event.accept()
             else:
                 event.ignore()
@@ -662,6 +873,8 @@ def main():
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
     
+    app.setStyleSheet(DARK_QSS)
+    
     window = PortableAppConverter()
     window.show()
     
@@ -7,7 +7,7 @@ import sys
 import os
 
 # Dependencies
-packages = ["PyQt5", "psutil", "py7zr", "configparser"]
+packages = ["PyQt5", "py7zr", "configparser"]
 excludes = ["tkinter"]
 
 # Include files (only if they exist)